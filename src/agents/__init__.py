@@ -6,6 +6,7 @@ This module provides a clean interface to all agent functions used in the workfl
 
 from .brief_parser import parse_brief
 from .brief_validator import validate_brief
+from .brief_merger import merge_brief
 from .headline_generator import generate_headlines
 from .content_editor import make_editorial_decisions
 from .researcher import conduct_research
@@ -14,6 +15,7 @@ from .content_writer import write_content, revise_content
 __all__ = [
     "parse_brief",
     "validate_brief",
+    "merge_brief",
     "generate_headlines",
     "make_editorial_decisions",
     "conduct_research",
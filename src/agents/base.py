@@ -1,14 +1,31 @@
-from typing import Type, TypeVar, Generic, Any, List, Union
+from contextlib import contextmanager
+from typing import (
+    Type,
+    TypeVar,
+    Generic,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 from pydantic import BaseModel
 from pydantic_ai import Agent
-from pydantic_ai.messages import BinaryContent, ImageUrl, AudioUrl, DocumentUrl
+from pydantic_ai.models import Model
+from pydantic_ai.messages import (
+    BinaryContent,
+    ImageUrl,
+    AudioUrl,
+    DocumentUrl,
+    ToolCallPart,
+)
+from pydantic_core import from_json
 
 from src.utils.logging import logger, log_object
-from src.utils.observability import (
-    flush_traces,
-    configure_observability,
-)
+from src.utils.llm_cache import LLMCache, llm_cache
+from src.utils.observability import configure_observability
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -29,6 +46,7 @@ class BaseAgent(Generic[T]):
         deps_type: Type = None,
         temperature: float = 0.0,
         tools: List[callable] = None,
+        cache: bool = False,
     ):
         """Initialize the base agent.
 
@@ -40,6 +58,8 @@ class BaseAgent(Generic[T]):
             deps: Optional dependencies object required by tools/agent
             temperature: Model temperature setting
             tools: Optional list of tools to register with the agent
+            cache: Reuse outputs for identical text inputs when the
+                response cache is enabled
         """
         self.name = name
         self.model_name = model_name
@@ -49,6 +69,9 @@ class BaseAgent(Generic[T]):
         self.deps_type = deps_type or (type(deps) if deps else None)
         self.temperature = temperature
         self.tools = tools or []
+        self.cache = cache
+        # Name of the model set by override(), used to key cached outputs
+        self._model_override: Optional[str] = None
 
         # Lazy initialization - create agent when first needed
         self._agent = None
@@ -83,6 +106,35 @@ class BaseAgent(Generic[T]):
         logger.info(f"Agent created: {agent.name}")
         return agent
 
+    @contextmanager
+    def override(self, model: Union[Model, str]) -> Iterator[None]:
+        """Run the agent on another model, e.g. TestModel in tests.
+
+        Use this rather than agent.override() so cached outputs from the
+        configured model are never replayed for the override.
+        """
+        previous = self._model_override
+        self._model_override = (
+            model if isinstance(model, str) else model.model_name
+        )
+        try:
+            with self.agent.override(model=model):
+                yield
+        finally:
+            self._model_override = previous
+
+    def _cache_key(self, inputs: str) -> str:
+        """Key for everything that shapes the response to a text input."""
+        return LLMCache.make_key(
+            self.name,
+            self._model_override or self.model_name,
+            self.temperature,
+            [tool.__name__ for tool in self.tools],
+            self.output_type.__name__,
+            self.system_prompt,
+            inputs,
+        )
+
     def register_tools(self, tools: List[callable]) -> None:
         """Register tools with the underlying pydantic_ai Agent."""
         if not tools:
@@ -109,20 +161,88 @@ class BaseAgent(Generic[T]):
         Returns:
             The Pydantic model instance representing the agent's result
         """
+        cache_key = None
+        # Run kwargs such as model_settings change the response, so skip
+        if (
+            self.cache
+            and llm_cache is not None
+            and isinstance(inputs, str)
+            and not kwargs
+        ):
+            cache_key = self._cache_key(inputs)
+            cached = llm_cache.get(cache_key, self.output_type)
+            if cached is not None:
+                logger.info(f"Cache hit for agent: {self.name}")
+                return cached
+
         try:
             run_kwargs = kwargs.copy()
             if self.deps:
                 run_kwargs["deps"] = self.deps
 
             result = await self.agent.run(inputs, **run_kwargs)
-            flush_traces()
             log_object(
                 title=f"Agent: {self.name}",
                 object=result.output,
                 subtitle=f"Model: {self.model_name}",
             )
+            if cache_key:
+                llm_cache.set(cache_key, result.output)
             return result.output
         except Exception as e:
             logger.error(f"Agent analysis failed: {e}")
-            flush_traces()
             raise
+
+    async def run_stream(
+        self,
+        inputs: str,
+        on_partial: Optional[Callable[[dict[str, Any]], None]] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run the agent, streaming partially generated output to a callback.
+
+        Args:
+            inputs: The user input
+            on_partial: Called with the output fields generated so far
+            **kwargs: Additional keyword arguments for the agent run
+
+        Returns:
+            The Pydantic model instance representing the agent's result
+        """
+        try:
+            run_kwargs = kwargs.copy()
+            if self.deps:
+                run_kwargs["deps"] = self.deps
+
+            async with self.agent.run_stream(inputs, **run_kwargs) as result:
+                if on_partial:
+                    async for message, _ in result.stream_structured():
+                        for part in message.parts:
+                            if isinstance(part, ToolCallPart):
+                                on_partial(_partial_args(part.args))
+                output = await result.get_output()
+
+            log_object(
+                title=f"Agent: {self.name}",
+                object=output,
+                subtitle=f"Model: {self.model_name}",
+            )
+            return output
+        except Exception as e:
+            logger.error(f"Agent analysis failed: {e}")
+            raise
+
+
+def _partial_args(args: Union[str, dict[str, Any], None]) -> dict[str, Any]:
+    """Parse possibly incomplete tool call arguments into a dict."""
+    if isinstance(args, dict):
+        return args
+    if not args:
+        return {}
+
+    try:
+        parsed = from_json(args, allow_partial=True)
+    except ValueError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
@@ -0,0 +1,23 @@
+from src.agents.base import BaseAgent
+from src.models.agent_outputs import ContentBrief
+from src.prompts.prompt_manager import PromptManager
+
+agent = BaseAgent(
+    name="brief_merger",
+    output_type=ContentBrief,
+    system_prompt=PromptManager.get_prompt("brief_merger"),
+    model_name="openai:gpt-4o-mini",
+    temperature=0.0,
+    cache=True,
+)
+
+
+async def merge_brief(
+    existing: ContentBrief, user_response: str
+) -> ContentBrief:
+    """Patch an existing ContentBrief with the user's clarification."""
+    merge_prompt = (
+        f"{existing.model_dump_json()}\n\nUser clarification: {user_response}"
+    )
+
+    return await agent.run(merge_prompt)
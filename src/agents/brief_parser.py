@@ -8,6 +8,7 @@ agent = BaseAgent(
     system_prompt=PromptManager.get_prompt("brief_parser"),
     model_name="openai:gpt-4o-mini",
     temperature=0.1,
+    cache=True,
 )
 
 
@@ -8,11 +8,26 @@ agent = BaseAgent(
     system_prompt=PromptManager.get_prompt("brief_validator"),
     model_name="openai:gpt-4o-mini",
     temperature=0.1,
+    cache=True,
 )
 
+# Brief fields that must be filled in before validation is worth an LLM call
+REQUIRED_FIELDS = ("topic", "target_audience", "content_type", "tone")
+
 
 async def validate_brief(brief: ContentBrief) -> BriefValidation:
     """Validate a ContentBrief for Cole & Greg framework readiness."""
+    missing = _missing_fields(brief)
+    if missing:
+        # Obviously incomplete briefs don't need the LLM to say so
+        return BriefValidation(
+            is_complete=False,
+            missing_fields=missing,
+            clarifying_questions="Please specify: "
+            + ", ".join(field.replace("_", " ") for field in missing),
+            suggestions=[],
+        )
+
     validation_prompt = f"""
     Validate this content brief for strategic content creation readiness:
 
@@ -22,3 +37,13 @@ async def validate_brief(brief: ContentBrief) -> BriefValidation:
     """
 
     return await agent.run(validation_prompt)
+
+
+def _missing_fields(brief: ContentBrief) -> list[str]:
+    """Return the required brief fields that are empty."""
+    missing = [
+        field for field in REQUIRED_FIELDS if not getattr(brief, field).strip()
+    ]
+    if not brief.key_points:
+        missing.append("key_points")
+    return missing
@@ -11,6 +11,7 @@ agent = BaseAgent(
     model_name="openai:gpt-4o-mini",
     temperature=0.1,
     tools=[style_guidelines],
+    cache=True,
 )
 
 
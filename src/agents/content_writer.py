@@ -1,3 +1,5 @@
+from typing import Any, Callable, Optional
+
 from src.agents.base import BaseAgent
 from src.models.agent_outputs import DraftContent
 from src.graph.state import WorkflowState
@@ -18,8 +20,11 @@ agent = BaseAgent(
 )
 
 
-async def write_content(state: WorkflowState) -> DraftContent:
-    """Write content based on plan and research."""
+async def write_content(
+    state: WorkflowState,
+    on_partial: Optional[Callable[[dict[str, Any]], None]] = None,
+) -> DraftContent:
+    """Write content based on plan and research, streaming partial drafts."""
     writing_prompt = PromptManager.get_prompt(
         "content_writer",
         selected_content_idea=state.selected_content_idea,
@@ -30,13 +35,14 @@ async def write_content(state: WorkflowState) -> DraftContent:
         current_content=None,
     )
 
-    return await agent.run(writing_prompt)
+    return await agent.run_stream(writing_prompt, on_partial)
 
 
 async def revise_content(
     state: WorkflowState,
+    on_partial: Optional[Callable[[dict[str, Any]], None]] = None,
 ) -> DraftContent:
-    """Revise content based on human feedback."""
+    """Revise content based on human feedback, streaming partial drafts."""
     revision_prompt = PromptManager.get_prompt(
         "content_writer",
         selected_content_idea=state.selected_content_idea,
@@ -47,4 +53,4 @@ async def revise_content(
         current_content=state.draft_content,
     )
 
-    return await agent.run(revision_prompt)
+    return await agent.run_stream(revision_prompt, on_partial)
@@ -1,11 +1,16 @@
+import asyncio
+
 from src.agents.base import BaseAgent
-from src.models.agent_outputs import HeadlineOptions
+from src.models.agent_outputs import HeadlineBatch, HeadlineOptions
 from src.graph.state import WorkflowState
 from src.prompts.prompt_manager import PromptManager
 
+# Headline styles generated concurrently, one batch of variations each
+HEADLINE_STYLES = ("tactical", "strategic", "contrarian")
+
 agent = BaseAgent(
     name="headline_generator",
-    output_type=HeadlineOptions,
+    output_type=HeadlineBatch,
     system_prompt=PromptManager.get_prompt("headline_generator_system"),
     model_name="openai:gpt-4o",
     temperature=0.2,
@@ -14,10 +19,33 @@ agent = BaseAgent(
 
 async def generate_headlines(state: WorkflowState) -> HeadlineOptions:
     """Generate multiple headline variations following Cole & Greg framework."""
+    batches = await asyncio.gather(
+        *(_generate_batch(state, style) for style in HEADLINE_STYLES)
+    )
+    variations = [
+        variation for batch in batches for variation in batch.variations
+    ]
+
+    ranked = sorted(
+        range(len(variations)),
+        key=lambda i: (
+            variations[i].hook_strength + variations[i].target_audience_fit
+        ),
+        reverse=True,
+    )
+
+    return HeadlineOptions(variations=variations, recommended_top_3=ranked[:3])
+
+
+async def _generate_batch(
+    state: WorkflowState, headline_style: str
+) -> HeadlineBatch:
+    """Generate one batch of headline variations in a single style."""
     prompt = PromptManager.get_prompt(
         "headline_generator",
         content_brief=state.content_brief,
         consolidated_research=state.consolidated_research,
+        headline_style=headline_style,
     )
 
     return await agent.run(prompt)
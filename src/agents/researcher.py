@@ -23,6 +23,7 @@ async def conduct_research(state: WorkflowState) -> ConsolidatedResearch:
         key_points=state.content_brief.key_points,
         target_audience=state.content_brief.target_audience,
         call_to_action=state.content_brief.call_to_action,
+        web_research=state.web_research,
     )
 
     return await agent.run(research_prompt)
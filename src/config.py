@@ -2,6 +2,8 @@
 Simple configuration for the content creation pipeline.
 """
 
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -22,6 +24,10 @@ class Settings(BaseSettings):
     tavily_api_key: str
     youtube_actor_id: str = "streamers-youtube-scraper"
 
+    # LLM response cache for structural agents (disabled unless a SQLite
+    # path is set)
+    llm_cache_path: Optional[str] = None
+
 
 # Create a global settings instance
 settings = Settings()
@@ -2,13 +2,17 @@
 Graph construction and routing logic for the content creation pipeline.
 """
 
-from langgraph.graph import StateGraph, END
+import asyncio
+from functools import lru_cache
+
+from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command
 
 from src.graph.state import WorkflowState
 from src.utils.logging import logger
 from src.graph.nodes import (
     parse_brief_node,
+    prefetch_research_node,
     validate_brief_node,
     enhance_brief_node,
     research_node,
@@ -16,27 +20,36 @@ from src.graph.nodes import (
     select_headline_node,
     make_editorial_decisions_node,
     write_content_node,
+    revise_content_node,
     human_review_node,
 )
 
 
+# Pipelines run at once by run_content_pipeline_batch
+BATCH_CONCURRENCY = 16
+
+# Revision rounds allowed before the draft is finalized as is
+MAX_REVISIONS = 3
+
+# Fixed routes for the other feedback types, anything else finalizes
+_FEEDBACK_ROUTES: dict[str, str] = {
+    "approve": "finalize",
+    "change_plan": "plan_content",
+}
+
+
 def process_human_feedback(state: WorkflowState) -> str:
     """Process human feedback and decide next action."""
-    if not state.human_feedback:
+    feedback = state.human_feedback
+    if not feedback:
         return "finalize"  # Should not happen, but safety check
 
-    feedback_type = state.human_feedback.feedback_type
-
-    if feedback_type == "approve":
-        return "finalize"
-    elif feedback_type == "edit_content":
-        if state.revision_count >= 3:  # Prevent infinite loops
+    if feedback.feedback_type == "edit_content":
+        if state.revision_count >= MAX_REVISIONS:  # Prevent infinite loops
             return "finalize"
-        return "write_content"
-    elif feedback_type == "change_plan":
-        return "plan_content"
-    else:
-        return "finalize"  # Default case
+        return "revise_content"
+
+    return _FEEDBACK_ROUTES.get(feedback.feedback_type, "finalize")
 
 
 def route_after_validation(state: WorkflowState) -> str:
@@ -52,6 +65,7 @@ def create_content_workflow() -> StateGraph:
     workflow = StateGraph(WorkflowState)
 
     workflow.add_node("parse_brief", parse_brief_node)
+    workflow.add_node("prefetch_research", prefetch_research_node)
     workflow.add_node("validate_brief", validate_brief_node)
     workflow.add_node("enhance_brief", enhance_brief_node)
     workflow.add_node("conduct_research", research_node)
@@ -61,9 +75,13 @@ def create_content_workflow() -> StateGraph:
         "make_editorial_decisions", make_editorial_decisions_node
     )
     workflow.add_node("write_content", write_content_node)
+    workflow.add_node("revise_content", revise_content_node)
     workflow.add_node("human_review", human_review_node)
 
-    workflow.set_entry_point("parse_brief")
+    # Prefetch web results alongside the brief-parsing LLM call
+    workflow.add_edge(START, "parse_brief")
+    workflow.add_edge(START, "prefetch_research")
+    workflow.add_edge("prefetch_research", END)
 
     workflow.add_edge("parse_brief", "validate_brief")
     workflow.add_conditional_edges(
@@ -80,13 +98,14 @@ def create_content_workflow() -> StateGraph:
     workflow.add_edge("select_headline", "make_editorial_decisions")
     workflow.add_edge("make_editorial_decisions", "write_content")
     workflow.add_edge("write_content", "human_review")
+    workflow.add_edge("revise_content", "human_review")
 
     workflow.add_conditional_edges(
         "human_review",
         process_human_feedback,
         {
             "finalize": END,
-            "write_content": "write_content",
+            "revise_content": "revise_content",
             "plan_content": "make_editorial_decisions",
         },
     )
@@ -94,10 +113,20 @@ def create_content_workflow() -> StateGraph:
     return workflow
 
 
+@lru_cache(maxsize=1)
+def _get_app():
+    """Compile the non-interactive workflow once per process."""
+    return create_content_workflow().compile()
+
+
 async def run_content_pipeline(user_input: str) -> WorkflowState:
     """
     Run the complete content creation pipeline.
 
+    Runs non-interactively: the brief is used as parsed, the top headline
+    recommendation is selected and the first draft is approved. Interactive
+    runs use execute_with_interrupts instead.
+
     Args:
         user_input: Free text content brief from user
 
@@ -105,31 +134,73 @@ async def run_content_pipeline(user_input: str) -> WorkflowState:
         Final workflow state with completed content
     """
 
-    workflow = create_content_workflow()
-    app = workflow.compile()
+    return await _run_pipeline(_get_app(), user_input)
+
+
+async def run_content_pipeline_batch(
+    user_inputs: list[str],
+) -> list[WorkflowState | Exception]:
+    """
+    Run the pipeline non-interactively for several briefs concurrently.
 
+    Args:
+        user_inputs: Free text content briefs from users
+
+    Returns:
+        Final workflow states, in the same order as the inputs. A brief
+        that failed has its exception in its place, so one failure does
+        not discard the other results.
+    """
+    app = _get_app()
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run_one(user_input: str) -> WorkflowState:
+        async with semaphore:
+            return await _run_pipeline(app, user_input)
+
+    results = await asyncio.gather(
+        *(run_one(user_input) for user_input in user_inputs),
+        return_exceptions=True,
+    )
+
+    for user_input, result in zip(user_inputs, results):
+        if isinstance(result, Exception):
+            logger.error(
+                f"Content creation pipeline failed for input "
+                f"{user_input[:100]!r}: {result}"
+            )
+
+    return results
+
+
+async def _run_pipeline(app, user_input: str) -> WorkflowState:
+    """Run one brief through a compiled workflow."""
     initial_state = WorkflowState(
-        original_input=user_input, current_step="parse_brief"
+        original_input=user_input,
+        current_step="parse_brief",
+        interactive=False,
     )
 
     logger.info(
         f"Starting content creation pipeline with input: {user_input[:100]}..."
     )
 
-    final_state = None
-    async for step in app.astream(initial_state):
-        current_node = list(step.keys())[0]
-        current_state = step[current_node]
-        final_state = current_state
+    # No per-step streaming needed here; interactive runs use
+    # execute_with_interrupts instead
+    final_values = await app.ainvoke(initial_state)
 
-        if hasattr(current_state, "current_step"):
-            logger.debug(f"Current step: {current_state.current_step}")
+    if interrupts := final_values.get("__interrupt__"):
+        # Nodes skip interrupts in non-interactive runs, so this is a bug
+        pending = "; ".join(str(item.value) for item in interrupts)
+        raise RuntimeError(
+            f"Content creation pipeline stopped at interrupt: {pending}"
+        )
 
     logger.info("Content creation pipeline completed")
 
-    if final_state:
-        final_state.is_complete = True
-        final_state.update_step("completed")
+    final_state = WorkflowState.model_validate(final_values)
+    final_state.is_complete = True
+    final_state.update_step("completed")
 
     return final_state
 
@@ -138,7 +209,7 @@ async def execute_with_interrupts(
     app, command_or_state, config, interrupt_handler
 ):
     """
-    Recursively execute workflow, handling any depth of interrupts.
+    Execute workflow, resuming after any number of interrupts.
 
     Args:
         app: Compiled LangGraph application
@@ -146,13 +217,19 @@ async def execute_with_interrupts(
         config: LangGraph configuration (thread_id, etc.)
         interrupt_handler: Async function to handle interrupts
     """
-    async for event in app.astream(command_or_state, config):
-        event_name = list(event.keys())[0]
-        logger.debug(f"Processing event: {event_name}")
-
-        if event_name == "__interrupt__":
-            user_response = await interrupt_handler(app, config)
-            await execute_with_interrupts(
-                app, Command(resume=user_response), config, interrupt_handler
-            )
-            break
+    current = command_or_state
+    while True:
+        interrupted = False
+        async for event in app.astream(current, config):
+            event_name = next(iter(event))
+            # Lazy formatting: this runs for every graph step
+            logger.debug("Processing event: %s", event_name)
+
+            if event_name == "__interrupt__":
+                user_response = await interrupt_handler(app, config)
+                current = Command(resume=user_response)
+                interrupted = True
+                break
+
+        if not interrupted:
+            return
@@ -2,15 +2,18 @@
 Workflow node functions for the content creation pipeline.
 """
 
-from typing import Any
+import re
+from typing import Any, Awaitable, Callable
 from langgraph.types import interrupt
 
 from src.graph.state import WorkflowState, HumanFeedback
 from src.utils.logging import logger
-from src.models.agent_outputs import BriefValidation
+from src.models.agent_outputs import BriefValidation, DraftContent
+from src.tools.web_search import search_web
 from src.agents import (
     parse_brief,
     validate_brief,
+    merge_brief,
     generate_headlines,
     make_editorial_decisions,
     conduct_research,
@@ -18,6 +21,33 @@ from src.agents import (
     revise_content,
 )
 
+# Words of the raw brief used as the speculative research query
+PREFETCH_QUERY_WORDS = 30
+
+# Characters of the draft shown while it is still being written
+PREVIEW_CHARS = 300
+
+# Leading number in the user's headline choice, e.g. "2" or "2 please"
+_CHOICE_RE = re.compile(r"\s*(\d+)")
+
+# Feedback that starts with "approve" or "approved" as a whole word, so
+# "Approved!" finalizes but "don't approve yet" is an edit
+_APPROVE_RE = re.compile(r"\s*approved?\b", re.IGNORECASE)
+
+# Validation result recorded once the user has filled in missing details
+_COMPLETE_VALIDATION = BriefValidation(
+    is_complete=True,
+    missing_fields=[],
+    clarifying_questions="",
+    suggestions=[],
+)
+
+# Review outcome for non-interactive runs, which finalize the first draft
+_AUTO_APPROVAL = HumanFeedback(
+    feedback_type="approve",
+    comments="Approved automatically (non-interactive run)",
+)
+
 
 async def parse_brief_node(state: WorkflowState) -> dict[str, Any]:
     """Parse free text input into structured ContentBrief."""
@@ -28,13 +58,32 @@ async def parse_brief_node(state: WorkflowState) -> dict[str, Any]:
     return {"content_brief": brief}
 
 
+async def prefetch_research_node(state: WorkflowState) -> dict[str, Any]:
+    """Search the web on the raw brief while it is being parsed."""
+    logger.info("Prefetching web research")
+
+    query = " ".join(state.original_input.split()[:PREFETCH_QUERY_WORDS])
+    try:
+        results = await search_web(query)
+    except Exception as e:
+        # Research still runs its own searches, so this is best effort
+        logger.warning(f"Research prefetch failed: {e}")
+        return {}
+
+    return {"web_research": results}
+
+
 async def validate_brief_node(state: WorkflowState) -> dict[str, Any]:
     """Validate brief completeness and ask clarifying questions if needed."""
     logger.info("Validating content brief")
 
     validation = await validate_brief(state.content_brief)
 
-    if not validation.is_complete and validation.clarifying_questions:
+    needs_details = (
+        not validation.is_complete and validation.clarifying_questions
+    )
+    # Non-interactive runs research the brief as parsed
+    if needs_details and state.interactive:
         user_response = interrupt(validation.clarifying_questions)
 
         return {
@@ -46,23 +95,17 @@ async def validate_brief_node(state: WorkflowState) -> dict[str, Any]:
 
 
 async def enhance_brief_node(state: WorkflowState) -> dict[str, Any]:
-    """Enhance brief with user response and re-parse."""
+    """Enhance brief by merging the user response into it."""
     logger.info("Processing additional user details")
 
-    # Combine original input with user response
-    enhanced_input = (
-        f"{state.original_input}\n\nAdditional details: {state.user_response}"
+    # Only the clarification is new; patch the parsed brief with it
+    enhanced_brief = await merge_brief(
+        state.content_brief, state.user_response
     )
-    enhanced_brief = await parse_brief(enhanced_input)
 
     return {
         "content_brief": enhanced_brief,
-        "brief_validation": BriefValidation(
-            is_complete=True,
-            missing_fields=[],
-            clarifying_questions="",
-            suggestions=[],
-        ),
+        "brief_validation": _COMPLETE_VALIDATION,
     }
 
 
@@ -89,32 +132,37 @@ async def select_headline_node(state: WorkflowState) -> dict[str, Any]:
     logger.info("Presenting headline variations for selection")
 
     headlines = state.headline_options
-
-    print("\n📰 TOP HEADLINE RECOMMENDATIONS:")
-    for i, idx in enumerate(headlines.recommended_top_3, 1):
-        variation = headlines.variations[idx]
-        print(f"\n{i}. {variation.headline}")
-        print(f"   Hook Strength: {variation.hook_strength}/10")
-        print(f"   Audience Fit: {variation.target_audience_fit}/10")
-        print("   Main Points:")
-        for j, point in enumerate(variation.main_points, 1):
-            print(f"     {j}. {point}")
+    top3 = headlines.recommended_top_3
+    variations = headlines.variations
+
+    if not state.interactive:
+        # Non-interactive runs take the top recommendation
+        return {"selected_headline_variation": variations[top3[0]]}
+
+    lines = ["\n📰 TOP HEADLINE RECOMMENDATIONS:"]
+    for i, idx in enumerate(top3, 1):
+        variation = variations[idx]
+        lines.append(f"\n{i}. {variation.headline}")
+        lines.append(f"   Hook Strength: {variation.hook_strength}/10")
+        lines.append(f"   Audience Fit: {variation.target_audience_fit}/10")
+        lines.append("   Main Points:")
+        lines.extend(
+            f"     {j}. {point}"
+            for j, point in enumerate(variation.main_points, 1)
+        )
+    print("\n".join(lines))
 
     user_choice = interrupt(
         "Please select which headline you'd like to proceed with (1, 2, or 3):"
     )
 
-    try:
-        choice_index = int(user_choice.strip()) - 1
-        if 0 <= choice_index < len(headlines.recommended_top_3):
-            selected_idx = headlines.recommended_top_3[choice_index]
-            selected_headline = headlines.variations[selected_idx]
-        else:
-            selected_idx = headlines.recommended_top_3[0]
-            selected_headline = headlines.variations[selected_idx]
-    except (ValueError, IndexError):
-        selected_idx = headlines.recommended_top_3[0]
-        selected_headline = headlines.variations[selected_idx]
+    # Fall back to the first recommendation on anything but a valid number
+    match = _CHOICE_RE.match(user_choice)
+    choice_index = int(match.group(1)) - 1 if match else 0
+    if not 0 <= choice_index < len(top3):
+        choice_index = 0
+
+    selected_headline = variations[top3[choice_index]]
 
     return {"selected_headline_variation": selected_headline}
 
@@ -131,41 +179,87 @@ async def make_editorial_decisions_node(
 
 
 async def write_content_node(state: WorkflowState) -> dict[str, Any]:
-    """Write content based on plan and research."""
+    """Write the initial draft based on plan and research."""
     logger.info("Writing content")
 
-    if (
-        state.human_feedback
-        and state.human_feedback.feedback_type == "edit_content"
-    ):
-        content = await revise_content(state)
-        revision_count = state.revision_count + 1
-    else:
-        content = await write_content(state)
-        revision_count = state.revision_count
+    content = await _stream_draft(write_content, state)
+
+    return {"draft_content": content}
+
+
+async def revise_content_node(state: WorkflowState) -> dict[str, Any]:
+    """Revise the current draft based on human feedback."""
+    logger.info("Revising content")
+
+    content = await _stream_draft(revise_content, state)
 
     return {
         "draft_content": content,
-        "revision_count": revision_count,
+        "revision_count": state.revision_count + 1,
     }
 
 
+async def _stream_draft(
+    draft: Callable[..., Awaitable[DraftContent]], state: WorkflowState
+) -> DraftContent:
+    """Run a drafting agent, previewing the hook in interactive runs."""
+    if not state.interactive:
+        return await draft(state)
+
+    on_partial, finish = _draft_preview_printer()
+    content = await draft(state, on_partial)
+    finish(content)
+
+    return content
+
+
+def _draft_preview_printer() -> tuple[
+    Callable[[dict[str, Any]], None], Callable[[DraftContent], None]
+]:
+    """Build callbacks that print the draft's hook exactly once.
+
+    The first is fed partial output while streaming; the second takes the
+    finished draft and prints the hook if streaming never did.
+    """
+    printed = False
+
+    def print_preview(hook: str) -> None:
+        nonlocal printed
+        print(f"\n📝 DRAFT PREVIEW: {hook[:PREVIEW_CHARS]}...")
+        printed = True
+
+    def on_partial(partial: dict[str, Any]) -> None:
+        hook = partial.get("hook_paragraph")
+        if printed or not isinstance(hook, str):
+            return
+
+        # Fields stream in order, so a field after the hook means it is done
+        hook_done = next(reversed(partial)) != "hook_paragraph"
+        if hook_done or len(hook) >= PREVIEW_CHARS:
+            print_preview(hook)
+
+    def finish(content: DraftContent) -> None:
+        if not printed:
+            print_preview(content.hook_paragraph)
+
+    return on_partial, finish
+
+
 async def human_review_node(state: WorkflowState) -> dict[str, Any]:
     """Present content for human review and collect feedback."""
     logger.info("Content ready for human review")
 
-    content = state.draft_content
+    if not state.interactive:
+        return {"human_feedback": _AUTO_APPROVAL}
 
-    print("\n📄 CONTENT PREVIEW:")
-    print(f"Title: {content.title}")
-    print(f"Word Count: {content.word_count}")
-    print(f"Preview: {content.content[:200]}...")
+    content = state.draft_content
 
+    # The hook was already printed while the draft streamed in
     user_feedback = interrupt(
-        f"Please review this content:\n\nTitle: {content.title}\nWord Count: {content.word_count}\nPreview: {content.content[:300]}...\n\nYour feedback (or say 'approve' to finish):"
+        f"Please review this content:\n\nTitle: {content.title}\nWord Count: {content.word_count}\n\nYour feedback (or say 'approve' to finish):"
     )
 
-    if "approve" in user_feedback.lower():
+    if _APPROVE_RE.match(user_feedback):
         feedback = HumanFeedback(
             feedback_type="approve",
             comments=user_feedback,
@@ -74,6 +74,8 @@ class WorkflowState(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     is_complete: bool = False
+    # False for batch runs: interrupts take their defaults instead of asking
+    interactive: bool = True
 
     def update_step(self, step: str):
         """Update the current workflow step."""
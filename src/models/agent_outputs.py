@@ -97,6 +97,17 @@ class HeadlineVariation(BaseModel):
     )
 
 
+class HeadlineBatch(BaseModel):
+    """Headline variations in a single style, generated in parallel."""
+
+    variations: List[HeadlineVariation] = Field(
+        ...,
+        description="Generated headline variations",
+        min_length=5,
+        max_length=5,
+    )
+
+
 class HeadlineOptions(BaseModel):
     """Collection of headline variations for strategic selection."""
 
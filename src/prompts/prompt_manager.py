@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from jinja2 import (
     Environment,
@@ -23,13 +24,19 @@ class PromptManager:
             )
         return cls._envs[templates_dir]
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_template(template):
+        # Render kwargs vary per call, so only the compiled template is cached
+        env = PromptManager._get_env()
+        template_content = env.loader.get_source(env, f"{template}.j2")[0]
+        return env.from_string(template_content)
+
     @staticmethod
     def get_prompt(template, **kwargs):
         env = PromptManager._get_env()
-        template_path = f"{template}.j2"
         try:
-            template_content = env.loader.get_source(env, template_path)[0]
-            return env.from_string(template_content).render(**kwargs)
+            return PromptManager._get_template(template).render(**kwargs)
         except TemplateError as e:
             templates_dir = Path(env.loader.searchpath[0])
             available_templates = list(templates_dir.glob("*.j2"))
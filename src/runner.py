@@ -2,6 +2,8 @@
 Content creation pipeline runner with interactive demo functionality.
 """
 
+import asyncio
+
 from langgraph.checkpoint.memory import MemorySaver
 from src.graph.builder import create_content_workflow, execute_with_interrupts
 from src.graph.state import WorkflowState
@@ -22,7 +24,9 @@ class ContentPipelineRunner:
         interrupt_message = current_state.tasks[0].interrupts[0].value
 
         print(f"\n❓ {interrupt_message}")
-        user_response = input("\nYour response: ").strip()
+        user_response = (
+            await asyncio.to_thread(input, "\nYour response: ")
+        ).strip()
         logger.info("Continuing workflow with user response")
         print("\n✅ Continuing workflow...")
 
@@ -33,7 +37,9 @@ class ContentPipelineRunner:
         print("🚀 Interactive Content Creation Pipeline")
         print("=" * 50)
 
-        user_input = input("\nEnter your brief: ").strip()
+        user_input = (
+            await asyncio.to_thread(input, "\nEnter your brief: ")
+        ).strip()
         print("\n" + "=" * 50)
 
         initial_state = WorkflowState(
@@ -15,6 +15,9 @@ from src.utils.logging import logger
 YOUTUBE_SEARCH_ACTOR = "h7sDV53CddomktSi5"
 TRANSCRIPT_ACTOR = "faVsWy9VTSNVIhWpR"
 
+# Transcript lookups run at once for a single search
+TRANSCRIPT_CONCURRENCY = 4
+
 
 class YouTubeVideo(BaseModel):
     """Structured representation of a YouTube video."""
@@ -81,27 +84,39 @@ async def get_youtube_videos(
 
     try:
         logger.info(f"Searching YouTube for: {query}")
-        run = client.actor(YOUTUBE_SEARCH_ACTOR).call(run_input=run_input)
-        dataset_items = list(
-            client.dataset(run["defaultDatasetId"]).iterate_items()
+        dataset_items = await asyncio.to_thread(
+            _run_actor, client, YOUTUBE_SEARCH_ACTOR, run_input
         )
 
-        videos = []
-        for item in dataset_items:
-            video = _parse_video_item(item)
-            if video:
-                transcript = await _get_transcript(video.url, client)
-                video.transcript = transcript
-                videos.append(video)
+        videos = [
+            video for video in map(_parse_video_item, dataset_items) if video
+        ][:max_results]
+
+        # Apify calls block, so fetch transcripts in parallel threads
+        semaphore = asyncio.Semaphore(TRANSCRIPT_CONCURRENCY)
+
+        async def attach_transcript(video: YouTubeVideo) -> None:
+            async with semaphore:
+                video.transcript = await _get_transcript(video.url, client)
+
+        await asyncio.gather(*(attach_transcript(video) for video in videos))
 
         logger.info(f"Found {len(videos)} videos for query: {query}")
-        return videos[:max_results]
+        return videos
 
     except Exception as e:
         logger.error(f"YouTube search failed: {e}")
         raise YouTubeSearchError(f"Failed to search YouTube: {e}") from e
 
 
+def _run_actor(
+    client: ApifyClient, actor_id: str, run_input: dict[str, any]
+) -> list[dict[str, any]]:
+    """Run an Apify actor and return its dataset items (blocking)."""
+    run = client.actor(actor_id).call(run_input=run_input)
+    return list(client.dataset(run["defaultDatasetId"]).iterate_items())
+
+
 def _parse_video_item(item: dict[str, any]) -> Optional[YouTubeVideo]:
     """Parse a video item from Apify response into structured format."""
     try:
@@ -136,9 +151,8 @@ async def _get_transcript(
 
     try:
         run_input = {"videoUrl": video_url}
-        run = client.actor(TRANSCRIPT_ACTOR).call(run_input=run_input)
-        transcript_items = list(
-            client.dataset(run["defaultDatasetId"]).iterate_items()
+        transcript_items = await asyncio.to_thread(
+            _run_actor, client, TRANSCRIPT_ACTOR, run_input
         )
 
         if not transcript_items:
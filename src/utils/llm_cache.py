@@ -0,0 +1,99 @@
+"""
+Response cache for structural agent calls.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from src.config import settings
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class LLMCache:
+    """In-process LRU cache of agent outputs, optionally backed by SQLite."""
+
+    def __init__(self, maxsize: int = 512, path: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses kept in memory
+            path: Optional SQLite file used to persist responses across runs
+        """
+        self.maxsize = maxsize
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._db = None
+
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at INTEGER NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash the JSON-serializable parts that determine an agent response."""
+        payload = json.dumps(parts).encode()
+        return hashlib.blake2b(payload).hexdigest()
+
+    def get(self, key: str, output_type: Type[T]) -> Optional[T]:
+        """Return a fresh copy of the cached output, or None on a miss."""
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+        elif self._db is not None:
+            row = self._db.execute(
+                "SELECT value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value = row[0]
+            self._remember(key, value)
+        else:
+            return None
+
+        try:
+            return output_type.model_validate_json(value)
+        except ValidationError:
+            # Output schema changed since this response was stored
+            return None
+
+    def set(self, key: str, output: BaseModel) -> None:
+        """Store an agent output under the given key."""
+        value = output.model_dump_json()
+        self._remember(key, value)
+
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._memory.clear()
+        if self._db is not None:
+            self._db.execute("DELETE FROM llm_cache")
+            self._db.commit()
+
+    def _remember(self, key: str, value: str) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+
+# Create a global cache instance, only when a cache file is configured
+llm_cache: Optional[LLMCache] = (
+    LLMCache(path=settings.llm_cache_path) if settings.llm_cache_path else None
+)
@@ -1,5 +1,6 @@
 """Simple Langfuse observability for AI agents."""
 
+import atexit
 import base64
 import logging
 import os
@@ -10,6 +11,13 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Langfuse is only used when all of its settings are present
+_OBS_ENABLED = bool(
+    settings.langfuse_public_key
+    and settings.langfuse_secret_key
+    and settings.langfuse_host
+)
+
 
 def configure_observability():
     """Configure logfire and Langfuse OTEL integration."""
@@ -18,12 +26,7 @@ def configure_observability():
         send_to_logfire=False,
     )
 
-    # Check if all Langfuse config is present
-    if (
-        settings.langfuse_public_key
-        and settings.langfuse_secret_key
-        and settings.langfuse_host
-    ):
+    if _OBS_ENABLED:
         auth = base64.b64encode(
             f"{settings.langfuse_public_key}:{settings.langfuse_secret_key}".encode()
         ).decode()
@@ -33,6 +36,8 @@ def configure_observability():
         os.environ["OTEL_EXPORTER_OTLP_HEADERS"] = ",".join(
             f"{k}={v}" for k, v in headers.items()
         )
+        # Spans are batched in the background; flush the tail once on exit
+        atexit.register(flush_traces)
         logger.info("Langfuse OTEL integration configured")
     else:
         logger.warning(
@@ -42,6 +47,9 @@ def configure_observability():
 
 def get_langfuse():
     """Get Langfuse client - uses environment variables for configuration."""
+    if not _OBS_ENABLED:
+        return None
+
     try:
         return get_client()
     except Exception as e:
@@ -51,6 +59,9 @@ def get_langfuse():
 
 def flush_traces():
     """Flush traces at the end of operations."""
+    if not _OBS_ENABLED:
+        return
+
     try:
         client = get_langfuse()
         if client:
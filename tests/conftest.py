@@ -2,14 +2,96 @@
 Shared pytest fixtures for all tests.
 """
 
+import json
+
 import pytest
 from unittest.mock import patch
 from pydantic_ai import models
 from pydantic_ai.models.test import TestModel
 
+from src.agents.base import BaseAgent
+from src.graph.state import HumanFeedback, WorkflowState
+from src.models.agent_outputs import (
+    ConsolidatedResearch,
+    ContentBrief,
+    ContentPlan,
+    ContentSection,
+    DraftContent,
+    HeadlineOptions,
+    HeadlineVariation,
+)
+from src.prompts.prompt_manager import PromptManager
+from src.utils.llm_cache import LLMCache
+
 # Disable real model requests globally
 models.ALLOW_MODEL_REQUESTS = False
 
+# Resolve every schema up front rather than inside whichever test is first
+for _model in (
+    WorkflowState,
+    HumanFeedback,
+    ConsolidatedResearch,
+    ContentBrief,
+    ContentPlan,
+    HeadlineOptions,
+    HeadlineVariation,
+    DraftContent,
+):
+    _model.model_rebuild()
+
+# Tool results are built once and returned as JSON, like a real tool payload
+_READABILITY_RESULT = json.dumps(
+    {
+        "flesch_score": 75.0,
+        "grade_level": 8.0,
+        "readability_level": "Standard",
+        "target_audience": "8th-9th grade",
+        "avg_sentence_length": 15.2,
+        "total_words": 850,
+        "total_sentences": 42,
+        "recommendations": [
+            "Readability is good - maintain current writing style",
+            "Consider adding more transitional phrases for better flow",
+        ],
+    }
+)
+
+_KEYWORD_DENSITY_RESULT = json.dumps(
+    {
+        "total_words": 850,
+        "keyword_analysis": {
+            "AI productivity": {
+                "exact_count": 8,
+                "density_percentage": 0.94,
+                "status": "optimal",
+                "recommendation": "Keyword density is well-optimized",
+                "word_counts": {"ai": 12, "productivity": 15},
+            },
+            "automation tools": {
+                "exact_count": 5,
+                "density_percentage": 0.59,
+                "status": "optimal",
+                "recommendation": "Keyword density is well-optimized",
+                "word_counts": {"automation": 8, "tools": 18},
+            },
+        },
+        "total_keyword_density": 1.53,
+        "overall_assessment": "Well-optimized keyword usage",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True, scope="session")
+async def _shared_event_loop(anyio_backend):
+    """Hold the anyio runner open so all async tests share one event loop."""
+    yield
+
 
 @pytest.fixture
 def mock_web_search():
@@ -37,21 +119,7 @@ def mock_web_search():
 def mock_analyze_readability():
     """Mock analyze_readability tool to return predictable readability analysis."""
     with patch("src.agents.content_writer.analyze_readability") as mock:
-        mock.return_value = str(
-            {
-                "flesch_score": 75.0,
-                "grade_level": 8.0,
-                "readability_level": "Standard",
-                "target_audience": "8th-9th grade",
-                "avg_sentence_length": 15.2,
-                "total_words": 850,
-                "total_sentences": 42,
-                "recommendations": [
-                    "Readability is good - maintain current writing style",
-                    "Consider adding more transitional phrases for better flow",
-                ],
-            }
-        )
+        mock.return_value = _READABILITY_RESULT
         yield mock
 
 
@@ -59,33 +127,11 @@ def mock_analyze_readability():
 def mock_check_keyword_density():
     """Mock check_keyword_density tool to return predictable keyword analysis."""
     with patch("src.agents.content_writer.check_keyword_density") as mock:
-        mock.return_value = str(
-            {
-                "total_words": 850,
-                "keyword_analysis": {
-                    "AI productivity": {
-                        "exact_count": 8,
-                        "density_percentage": 0.94,
-                        "status": "optimal",
-                        "recommendation": "Keyword density is well-optimized",
-                        "word_counts": {"ai": 12, "productivity": 15},
-                    },
-                    "automation tools": {
-                        "exact_count": 5,
-                        "density_percentage": 0.59,
-                        "status": "optimal",
-                        "recommendation": "Keyword density is well-optimized",
-                        "word_counts": {"automation": 8, "tools": 18},
-                    },
-                },
-                "total_keyword_density": 1.53,
-                "overall_assessment": "Well-optimized keyword usage",
-            }
-        )
+        mock.return_value = _KEYWORD_DENSITY_RESULT
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_web_search_func():
     """Mock function for web_search tool."""
 
@@ -101,51 +147,22 @@ def mock_web_search_func():
     return mock_search
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_readability_func():
     """Mock function for analyze_readability tool."""
 
     async def mock_analyze(ctx, content: str) -> str:
-        return str(
-            {
-                "flesch_score": 75.0,
-                "grade_level": 8.0,
-                "readability_level": "Standard",
-                "target_audience": "8th-9th grade",
-                "avg_sentence_length": 15.2,
-                "total_words": 850,
-                "total_sentences": 42,
-                "recommendations": [
-                    "Readability is good - maintain current writing style",
-                    "Consider adding more transitional phrases for better flow",
-                ],
-            }
-        )
+        return _READABILITY_RESULT
 
     return mock_analyze
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_keyword_func():
     """Mock function for check_keyword_density tool."""
 
     async def mock_check(ctx, content: str, keywords: list[str]) -> str:
-        return str(
-            {
-                "total_words": 850,
-                "keyword_analysis": {
-                    "AI productivity": {
-                        "exact_count": 8,
-                        "density_percentage": 0.94,
-                        "status": "optimal",
-                        "recommendation": "Keyword density is well-optimized",
-                        "word_counts": {"ai": 12, "productivity": 15},
-                    }
-                },
-                "total_keyword_density": 1.53,
-                "overall_assessment": "Well-optimized keyword usage",
-            }
-        )
+        return _KEYWORD_DENSITY_RESULT
 
     return mock_check
 
@@ -162,21 +179,27 @@ def mock_all_tools(
     }
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True, scope="session")
+def test_llm_cache():
+    """Enable an in-memory cache of agent outputs for the test session.
+
+    Keeps responses persisted by a developer's LLM_CACHE_PATH out of tests.
+    """
+    cache = LLMCache()
+    with patch("src.agents.base.llm_cache", cache):
+        yield cache
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
 def test_model_override():
     """Fixture to provide TestModel for agent overrides."""
     return TestModel(call_tools=[])
 
 
-@pytest.fixture
-def sample_workflow_state():
-    """Create a sample workflow state for testing across all agents."""
-    from src.graph.state import WorkflowState
-    from src.models.agent_outputs import (
-        ContentBrief,
-        ConsolidatedResearch,
-    )
-
+@pytest.fixture(scope="session")
+def _base_workflow_state():
+    """Build the sample workflow state once per test session."""
     return WorkflowState(
         original_input="Write about AI productivity tools",
         content_brief=ContentBrief(
@@ -207,10 +230,46 @@ def sample_workflow_state():
 
 
 @pytest.fixture
+def sample_workflow_state(_base_workflow_state):
+    """Create a sample workflow state for testing across all agents."""
+    # Tests mutate nested models too, so each one gets a deep copy
+    return _base_workflow_state.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def base_brief():
+    """Content brief shared by tests that vary a single field of it."""
+    return ContentBrief(
+        topic="AI Productivity Tools",
+        target_audience="business professionals",
+        content_type="blog_post",
+        tone="professional",
+        word_count_target=1000,
+        key_points=["efficiency", "automation"],
+        call_to_action="Try our tools",
+    )
+
+
+@pytest.fixture(scope="session")
+def base_research():
+    """Consolidated research shared by tests that only vary the brief."""
+    return ConsolidatedResearch(
+        web_research="AI tools market analysis",
+        youtube_research="Video content on AI tools",
+        general_background="General AI tools background",
+        key_insights=["Growing adoption", "Measurable ROI"],
+        unique_angles=["Focus on SMBs"],
+        expert_quotes=["AI is transforming work"],
+        statistics=["40% productivity increase"],
+        trending_topics=["automation"],
+        content_gaps=["Real examples needed"],
+        research_quality_score=0.8,
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_draft_content():
     """Create sample draft content for revision testing."""
-    from src.models.agent_outputs import DraftContent, ContentSection
-
     return DraftContent(
         title="Sample Content Title",
         hook_paragraph="Sample hook paragraph",
@@ -234,11 +293,9 @@ def sample_draft_content():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_human_feedback():
     """Create sample human feedback for revision testing."""
-    from src.graph.state import HumanFeedback
-
     return HumanFeedback(
         feedback_type="edit_content",
         comments="Make it more engaging and add more examples",
@@ -252,7 +309,7 @@ def sample_human_feedback():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_web_search_researcher():
     """Mock web_search for researcher agent."""
     with patch("src.agents.researcher.web_search") as mock:
@@ -279,15 +336,11 @@ def mock_web_search_researcher():
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_content_writer_agent(
     mock_web_search_func, mock_readability_func, mock_keyword_func
 ):
     """Create a content writer agent with mocked tools."""
-    from src.agents.base import BaseAgent
-    from src.models.agent_outputs import DraftContent
-    from src.prompts.prompt_manager import PromptManager
-
     return BaseAgent(
         name="content_writer",
         output_type=DraftContent,
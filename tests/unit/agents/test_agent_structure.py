@@ -0,0 +1,44 @@
+import pytest
+
+from src.agents import (
+    brief_merger,
+    brief_parser,
+    brief_validator,
+    content_editor,
+    content_writer,
+    headline_generator,
+    researcher,
+)
+from src.models.agent_outputs import (
+    BriefValidation,
+    ConsolidatedResearch,
+    ContentBrief,
+    ContentPlan,
+    DraftContent,
+    HeadlineBatch,
+)
+
+# (agent, name, output type, tool count, temperature)
+AGENTS = [
+    (brief_parser.agent, "brief_parser", ContentBrief, 0, 0.1),
+    (brief_validator.agent, "brief_validator", BriefValidation, 0, 0.1),
+    (brief_merger.agent, "brief_merger", ContentBrief, 0, 0.0),
+    # Higher temperature for creativity
+    (headline_generator.agent, "headline_generator", HeadlineBatch, 0, 0.2),
+    (researcher.agent, "researcher", ConsolidatedResearch, 1, 0.1),
+    (content_editor.agent, "content_editor", ContentPlan, 1, 0.1),
+    (content_writer.agent, "content_writer", DraftContent, 3, 0.1),
+]
+
+
+@pytest.mark.parametrize(
+    "agent,name,output_type,tool_count,temperature",
+    AGENTS,
+    ids=[name for _, name, *_ in AGENTS],
+)
+def test_agent_structure(agent, name, output_type, tool_count, temperature):
+    """Test that each agent is properly configured."""
+    assert agent.name == name
+    assert agent.output_type == output_type
+    assert len(agent.tools) == tool_count
+    assert agent.temperature == temperature
@@ -0,0 +1,21 @@
+import pytest
+
+from src.agents.brief_merger import agent, merge_brief
+from src.models.agent_outputs import ContentBrief
+
+pytestmark = pytest.mark.anyio(backends=["asyncio"])
+
+
+async def test_merge_brief_basic(sample_workflow_state, test_model_override):
+    """Test merging a clarification into an existing brief."""
+    brief = sample_workflow_state.content_brief
+
+    with agent.override(model=test_model_override):
+        result = await merge_brief(brief, "Focus on small business owners")
+
+    assert isinstance(result, ContentBrief)
+    assert result.topic
+    assert result.target_audience
+    assert result.content_type
+    assert result.tone
+    assert isinstance(result.key_points, list)
@@ -10,7 +10,7 @@ async def test_parse_brief_basic(test_model_override):
     """Test basic brief parsing functionality."""
     input_text = "Write a blog post about AI productivity tools for business professionals"
 
-    with agent.agent.override(model=test_model_override):
+    with agent.override(model=test_model_override):
         result = await parse_brief(input_text)
 
     assert isinstance(result, ContentBrief)
@@ -33,7 +33,7 @@ async def test_parse_brief_detailed_input(test_model_override):
     Call to action: Sign up for our productivity newsletter.
     """
 
-    with agent.agent.override(model=test_model_override):
+    with agent.override(model=test_model_override):
         result = await parse_brief(input_text)
 
     assert isinstance(result, ContentBrief)
@@ -50,7 +50,7 @@ async def test_parse_brief_minimal_input(test_model_override):
     """Test parsing with minimal input."""
     input_text = "Write about social media marketing"
 
-    with agent.agent.override(model=test_model_override):
+    with agent.override(model=test_model_override):
         result = await parse_brief(input_text)
 
     assert isinstance(result, ContentBrief)
@@ -59,11 +59,3 @@ async def test_parse_brief_minimal_input(test_model_override):
     assert result.content_type
     assert result.tone
     assert result.word_count_target is None or result.word_count_target > 0
-
-
-async def test_agent_structure():
-    """Test that the agent is properly configured."""
-    assert agent.name == "brief_parser"
-    assert agent.output_type == ContentBrief
-    assert agent.tools == []  # No tools for brief parser
-    assert agent.temperature == 0.1
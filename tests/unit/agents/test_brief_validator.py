@@ -12,7 +12,7 @@ async def test_validate_brief_complete(
     """Test validation of a complete brief."""
     brief = sample_workflow_state.content_brief
 
-    with agent.agent.override(model=test_model_override):
+    with agent.override(model=test_model_override):
         result = await validate_brief(brief)
 
     assert isinstance(result, BriefValidation)
@@ -34,7 +34,7 @@ async def test_validate_brief_incomplete(test_model_override):
         call_to_action="",  # Missing
     )
 
-    with agent.agent.override(model=test_model_override):
+    with agent.override(model=test_model_override):
         result = await validate_brief(brief)
 
     assert isinstance(result, BriefValidation)
@@ -44,6 +44,25 @@ async def test_validate_brief_incomplete(test_model_override):
     assert isinstance(result.clarifying_questions, str)
 
 
+async def test_validate_brief_missing_fields_skips_llm():
+    """Test briefs with empty required fields are rejected locally."""
+    brief = ContentBrief(
+        topic="AI tools",
+        target_audience="",
+        content_type="blog_post",
+        tone=" ",
+        key_points=[],
+    )
+
+    # No model override: model requests are disabled, so this fails if
+    # the LLM is called
+    result = await validate_brief(brief)
+
+    assert result.is_complete is False
+    assert result.missing_fields == ["target_audience", "tone", "key_points"]
+    assert "target audience" in result.clarifying_questions
+
+
 async def test_validate_brief_minimal_valid(test_model_override):
     """Test validation of a minimal but valid brief."""
     brief = ContentBrief(
@@ -56,7 +75,7 @@ async def test_validate_brief_minimal_valid(test_model_override):
         call_to_action="Contact us for consultation",
     )
 
-    with agent.agent.override(model=test_model_override):
+    with agent.override(model=test_model_override):
         result = await validate_brief(brief)
 
     assert isinstance(result, BriefValidation)
@@ -64,11 +83,3 @@ async def test_validate_brief_minimal_valid(test_model_override):
     assert isinstance(result.missing_fields, list)
     assert isinstance(result.suggestions, list)
     assert isinstance(result.clarifying_questions, str)
-
-
-async def test_agent_structure():
-    """Test that the agent is properly configured."""
-    assert agent.name == "brief_validator"
-    assert agent.output_type == BriefValidation
-    assert agent.tools == []  # No tools for brief validator
-    assert agent.temperature == 0.1
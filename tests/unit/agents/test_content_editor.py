@@ -6,6 +6,25 @@ from src.models.agent_outputs import ContentPlan, HeadlineVariation
 
 pytestmark = pytest.mark.anyio(backends=["asyncio"])
 
+# Shared across tests; never mutated, so no copy is needed
+_HL = HeadlineVariation(
+    headline="Transform Your Productivity with AI",
+    main_points=[
+        "Choose the right tools",
+        "Implement systematically",
+        "Measure results",
+    ],
+    hook_strength=8,
+    target_audience_fit=9,
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _override_model(test_model_override):
+    """Run every agent call in this module against the TestModel."""
+    with agent.override(model=test_model_override):
+        yield
+
 
 @pytest.fixture
 def mock_style_guidelines():
@@ -28,54 +47,45 @@ def mock_style_guidelines():
 
 
 async def test_make_editorial_decisions_basic(
-    sample_workflow_state, mock_style_guidelines, test_model_override
+    sample_workflow_state, mock_style_guidelines
 ):
     """Test basic editorial decision making functionality."""
     # Add a selected headline variation to the state
-    sample_workflow_state.selected_headline_variation = HeadlineVariation(
-        headline="Transform Your Productivity with AI",
-        main_points=[
-            "Choose the right tools",
-            "Implement systematically",
-            "Measure results",
-        ],
-        hook_strength=8,
-        target_audience_fit=9,
-    )
-
-    with agent.agent.override(model=test_model_override):
-        result = await make_editorial_decisions(sample_workflow_state)
-
-    assert isinstance(result, ContentPlan)
-    # Test the fields that actually exist in ContentPlan
-    assert hasattr(result, "selected_headline")
-    assert hasattr(result, "hook")
-    assert hasattr(result, "content_style")
-    assert hasattr(result, "key_ideas")
-    assert hasattr(result, "content_differentiation")
-    assert hasattr(result, "research_integration")
-    assert hasattr(result, "audience_alignment")
+    sample_workflow_state.selected_headline_variation = _HL
+
+    result = await make_editorial_decisions(sample_workflow_state)
+
+    assert type(result) is ContentPlan
+    # The plan fields the writer builds on must all be filled in
+    expected = {
+        "selected_headline",
+        "hook",
+        "content_style",
+        "key_ideas",
+        "content_differentiation",
+        "research_integration",
+        "audience_alignment",
+    }
+    assert all(getattr(result, field) for field in expected)
+    assert len(result.key_ideas) == 3
 
 
 async def test_make_editorial_decisions_without_headline(
-    sample_workflow_state, mock_style_guidelines, test_model_override
+    sample_workflow_state, mock_style_guidelines
 ):
     """Test editorial decisions when no headline variation is selected."""
     # Ensure no selected headline variation
     sample_workflow_state.selected_headline_variation = None
 
-    with agent.agent.override(model=test_model_override):
-        result = await make_editorial_decisions(sample_workflow_state)
+    result = await make_editorial_decisions(sample_workflow_state)
 
-    assert isinstance(result, ContentPlan)
-    assert hasattr(result, "selected_headline")
-    assert hasattr(result, "hook")
-    assert hasattr(result, "content_style")
-    assert hasattr(result, "key_ideas")
+    assert type(result) is ContentPlan
+    expected = {"selected_headline", "hook", "content_style", "key_ideas"}
+    assert all(getattr(result, field) for field in expected)
 
 
 async def test_make_editorial_decisions_with_rich_research(
-    sample_workflow_state, mock_style_guidelines, test_model_override
+    sample_workflow_state, mock_style_guidelines
 ):
     """Test editorial decisions with comprehensive research data."""
     # Enhance research data
@@ -88,17 +98,8 @@ async def test_make_editorial_decisions_with_rich_research(
         "Average time savings: 2.5 hours per week per employee",
     ]
 
-    with agent.agent.override(model=test_model_override):
-        result = await make_editorial_decisions(sample_workflow_state)
-
-    assert isinstance(result, ContentPlan)
-    assert hasattr(result, "selected_headline")
-    assert hasattr(result, "research_integration")
-
+    result = await make_editorial_decisions(sample_workflow_state)
 
-async def test_agent_structure(mock_style_guidelines):
-    """Test that the agent is properly configured."""
-    assert agent.name == "content_editor"
-    assert agent.output_type == ContentPlan
-    assert len(agent.tools) == 1  # style_guidelines tool
-    assert agent.temperature == 0.1
+    assert type(result) is ContentPlan
+    expected = {"selected_headline", "research_integration"}
+    assert all(getattr(result, field) for field in expected)
@@ -8,44 +8,50 @@ from src.models.agent_outputs import (
 pytestmark = pytest.mark.anyio(backends=["asyncio"])
 
 
-async def test_write_content_basic(sample_workflow_state, test_model_override):
+@pytest.fixture(autouse=True, scope="module")
+def _override_model(test_model_override):
+    """Run every agent call in this module against the TestModel."""
+    with agent.override(model=test_model_override):
+        yield
+
+
+async def test_write_content_basic(sample_workflow_state):
     """Test basic content writing functionality."""
 
-    with agent.agent.override(model=test_model_override):
-        result = await write_content(sample_workflow_state)
+    result = await write_content(sample_workflow_state)
 
-    assert isinstance(result, DraftContent)
+    assert type(result) is DraftContent
     assert result.title
     assert result.sections
     assert result.word_count >= 0
     assert result.readability_score >= 0
     assert result.readability_score <= 100
-    assert isinstance(result.sections, list)
     assert result.meta_description
-    assert isinstance(result.tags, list)
+
+
+async def test_write_content_streams_partial_output(sample_workflow_state):
+    """Test partial drafts are passed to the streaming callback."""
+    partials = []
+
+    result = await write_content(sample_workflow_state, partials.append)
+
+    assert type(result) is DraftContent
+    assert partials
+    assert all(isinstance(partial, dict) for partial in partials)
 
 
 async def test_revise_content_with_feedback(
     sample_workflow_state,
     sample_draft_content,
     sample_human_feedback,
-    test_model_override,
 ):
     """Test content revision with human feedback."""
     sample_workflow_state.draft_content = sample_draft_content
     sample_workflow_state.human_feedback = sample_human_feedback
 
-    with agent.agent.override(model=test_model_override):
-        result = await revise_content(sample_workflow_state)
+    result = await revise_content(sample_workflow_state)
 
-    assert isinstance(result, DraftContent)
+    assert type(result) is DraftContent
     assert result.title
     assert result.sections
     assert result.author_notes
-
-
-async def test_agent_structure():
-    """Test that the agent is properly configured."""
-    assert agent.name == "content_writer"
-    assert agent.output_type == DraftContent
-    assert len(agent.tools) == 3
@@ -1,40 +1,22 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from src.agents.researcher import agent, conduct_research
-from src.models.agent_outputs import ConsolidatedResearch
+from src.graph.state import WorkflowState
+from src.models.agent_outputs import ContentBrief, ConsolidatedResearch
 
 pytestmark = pytest.mark.anyio(backends=["asyncio"])
 
+# Validated once; each test swaps in its own input and brief
+_BASE_STATE = WorkflowState(original_input="placeholder")
 
-async def test_conduct_research_basic(
-    sample_workflow_state, mock_web_search_researcher, test_model_override
-):
-    """Test basic research functionality."""
-    with agent.agent.override(model=test_model_override):
-        result = await conduct_research(sample_workflow_state)
-
-    assert isinstance(result, ConsolidatedResearch)
-    assert result.web_research
-    assert isinstance(result.key_insights, list)
-    assert isinstance(result.unique_angles, list)
-    assert isinstance(result.expert_quotes, list)
-    assert isinstance(result.statistics, list)
-    assert isinstance(result.trending_topics, list)
-    assert isinstance(result.content_gaps, list)
-    assert result.research_quality_score >= 0.0
-    assert result.research_quality_score <= 1.0
-
-
-async def test_conduct_research_detailed_brief(
-    mock_web_search_researcher, test_model_override
-):
-    """Test research with a detailed content brief."""
-    from src.graph.state import WorkflowState
-    from src.models.agent_outputs import ContentBrief
-
-    detailed_state = WorkflowState(
-        original_input="Comprehensive guide on AI automation tools",
-        content_brief=ContentBrief(
+# (original input, brief) pairs researched alongside the sample state
+RESEARCH_BRIEFS = {
+    "detailed_brief": (
+        "Comprehensive guide on AI automation tools",
+        ContentBrief(
             topic="AI Automation Tools for Enterprise",
             target_audience="CTOs and technical decision makers",
             content_type="comprehensive_guide",
@@ -48,28 +30,10 @@ async def test_conduct_research_detailed_brief(
             ],
             call_to_action="Schedule a consultation with our AI experts",
         ),
-    )
-
-    with agent.agent.override(model=test_model_override):
-        result = await conduct_research(detailed_state)
-
-    assert isinstance(result, ConsolidatedResearch)
-    assert result.web_research
-    assert len(result.key_insights) >= 0
-    assert len(result.unique_angles) >= 0
-    assert result.research_quality_score >= 0.0
-
-
-async def test_conduct_research_technical_topic(
-    mock_web_search_researcher, test_model_override
-):
-    """Test research on technical topics."""
-    from src.graph.state import WorkflowState
-    from src.models.agent_outputs import ContentBrief
-
-    technical_state = WorkflowState(
-        original_input="Machine learning model deployment",
-        content_brief=ContentBrief(
+    ),
+    "technical_topic": (
+        "Machine learning model deployment",
+        ContentBrief(
             topic="MLOps and Model Deployment Best Practices",
             target_audience="data scientists and ML engineers",
             content_type="tutorial",
@@ -83,20 +47,54 @@ async def test_conduct_research_technical_topic(
             ],
             call_to_action="Try our ML deployment platform",
         ),
+    ),
+}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _override_model(test_model_override):
+    """Run every agent call in this module against the TestModel."""
+    with agent.override(model=test_model_override):
+        yield
+
+
+@pytest.fixture(scope="module")
+async def research_results(_base_workflow_state, mock_web_search_researcher):
+    """Research the sample state and every brief concurrently, once."""
+    states = {"basic": _base_workflow_state}
+    for name, (original_input, brief) in RESEARCH_BRIEFS.items():
+        states[name] = _BASE_STATE.model_copy(
+            update={"original_input": original_input, "content_brief": brief}
+        )
+
+    results = await asyncio.gather(
+        *(conduct_research(state) for state in states.values())
     )
+    return dict(zip(states, results))
 
-    with agent.agent.override(model=test_model_override):
-        result = await conduct_research(technical_state)
 
-    assert isinstance(result, ConsolidatedResearch)
+@pytest.mark.parametrize("case", ["basic", *RESEARCH_BRIEFS])
+async def test_conduct_research(case, research_results):
+    """Test research for the sample, detailed and technical briefs."""
+    result = research_results[case]
+
+    assert type(result) is ConsolidatedResearch
     assert result.web_research
-    assert isinstance(result.key_insights, list)
-    assert isinstance(result.trending_topics, list)
+    assert 0.0 <= result.research_quality_score <= 1.0
+
+
+async def test_conduct_research_builds_on_prefetched_results(base_brief):
+    """Test prefetched web results are rendered into the research prompt."""
+    state = _BASE_STATE.model_copy(
+        update={
+            "content_brief": base_brief,
+            "web_research": "Prefetched: tools save 5 hours a week",
+        }
+    )
 
+    with patch.object(agent, "run", AsyncMock()) as run:
+        await conduct_research(state)
 
-async def test_agent_structure():
-    """Test that the agent is properly configured."""
-    assert agent.name == "researcher"
-    assert agent.output_type == ConsolidatedResearch
-    assert len(agent.tools) == 1  # web_search tool
-    assert agent.temperature == 0.1
+    prompt = run.await_args.args[0]
+    assert "PRELIMINARY WEB RESULTS" in prompt
+    assert "Prefetched: tools save 5 hours a week" in prompt
@@ -0,0 +1,171 @@
+"""
+Test the workflow node functions outside of a compiled graph.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.graph.nodes import (
+    PREFETCH_QUERY_WORDS,
+    PREVIEW_CHARS,
+    _draft_preview_printer,
+    human_review_node,
+    prefetch_research_node,
+    select_headline_node,
+)
+from src.models.agent_outputs import HeadlineOptions, HeadlineVariation
+
+
+@pytest.fixture
+def headline_state(sample_workflow_state):
+    """Workflow state whose recommended headlines are variations 4, 7, 2."""
+    sample_workflow_state.headline_options = HeadlineOptions(
+        variations=[
+            HeadlineVariation(
+                headline=f"Headline {i}",
+                main_points=["First", "Second", "Third"],
+                hook_strength=7,
+                target_audience_fit=8,
+            )
+            for i in range(15)
+        ],
+        recommended_top_3=[4, 7, 2],
+    )
+    return sample_workflow_state
+
+
+@pytest.mark.anyio
+async def test_prefetch_research_truncates_query(sample_workflow_state):
+    """Test only the first PREFETCH_QUERY_WORDS words are searched."""
+    words = [f"word{i}" for i in range(PREFETCH_QUERY_WORDS + 10)]
+    sample_workflow_state.original_input = "  ".join(words)
+    search = AsyncMock(return_value="Prefetched results")
+
+    with patch("src.graph.nodes.search_web", search):
+        update = await prefetch_research_node(sample_workflow_state)
+
+    search.assert_awaited_once_with(" ".join(words[:PREFETCH_QUERY_WORDS]))
+    assert update == {"web_research": "Prefetched results"}
+
+
+@pytest.mark.anyio
+async def test_prefetch_research_failure_is_not_fatal(sample_workflow_state):
+    """Test a failed prefetch leaves the state untouched."""
+    search = AsyncMock(side_effect=RuntimeError("search unavailable"))
+
+    with patch("src.graph.nodes.search_web", search):
+        update = await prefetch_research_node(sample_workflow_state)
+
+    assert update == {}
+
+
+def test_draft_preview_waits_for_hook_to_finish(capsys, sample_draft_content):
+    """Test a short hook is printed once a later field starts streaming."""
+    on_partial, finish = _draft_preview_printer()
+
+    on_partial({"title": "Title", "hook_paragraph": "Short"})
+    assert capsys.readouterr().out == ""
+
+    on_partial(
+        {"title": "Title", "hook_paragraph": "Short hook", "sections": []}
+    )
+    on_partial({"hook_paragraph": "Short hook", "sections": [], "tags": []})
+    finish(sample_draft_content)
+
+    out = capsys.readouterr().out
+    assert out.count("DRAFT PREVIEW") == 1
+    assert "Short hook..." in out
+
+
+def test_draft_preview_ignores_fields_streamed_before_hook(capsys):
+    """Test fields ahead of the hook do not print a partial hook."""
+    on_partial, _ = _draft_preview_printer()
+
+    on_partial({"sections": [], "hook_paragraph": "Partial"})
+    assert capsys.readouterr().out == ""
+
+    on_partial({"sections": [], "hook_paragraph": "Partial hook", "tags": []})
+    assert "Partial hook..." in capsys.readouterr().out
+
+
+def test_draft_preview_prints_long_hook_while_streaming(capsys):
+    """Test a hook is previewed as soon as it reaches PREVIEW_CHARS."""
+    on_partial, _ = _draft_preview_printer()
+    hook = "x" * (PREVIEW_CHARS + 50)
+
+    on_partial({"hook_paragraph": hook})
+
+    out = capsys.readouterr().out
+    assert f"{'x' * PREVIEW_CHARS}..." in out
+    assert "x" * (PREVIEW_CHARS + 1) not in out
+
+
+def test_draft_preview_falls_back_to_final_draft(capsys, sample_draft_content):
+    """Test the finished draft's hook is printed if streaming never did."""
+    on_partial, finish = _draft_preview_printer()
+
+    on_partial({"title": "Title", "hook_paragraph": "Sample"})
+    finish(sample_draft_content)
+
+    out = capsys.readouterr().out
+    assert out.count("DRAFT PREVIEW") == 1
+    assert f"{sample_draft_content.hook_paragraph}..." in out
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "user_feedback,feedback_type",
+    [
+        ("approve", "approve"),
+        ("Approve.", "approve"),
+        ("Approved!", "approve"),
+        ("approve, thanks", "approve"),
+        ("  Approve, looks good", "approve"),
+        ("don't approve yet", "edit_content"),
+        ("approvement needed", "edit_content"),
+        ("Add more examples", "edit_content"),
+    ],
+)
+async def test_human_review_classifies_feedback(
+    user_feedback, feedback_type, sample_workflow_state, sample_draft_content
+):
+    """Test only feedback leading with the word approve finalizes."""
+    sample_workflow_state.draft_content = sample_draft_content
+
+    with patch("src.graph.nodes.interrupt", return_value=user_feedback):
+        update = await human_review_node(sample_workflow_state)
+
+    assert update["human_feedback"].feedback_type == feedback_type
+    assert update["human_feedback"].comments == user_feedback
+
+
+@pytest.mark.anyio
+async def test_select_headline_ignores_non_ascii_digits(headline_state):
+    """Test a superscript digit falls back instead of raising ValueError."""
+    with patch("src.graph.nodes.interrupt", return_value="²"):
+        update = await select_headline_node(headline_state)
+
+    assert update["selected_headline_variation"].headline == "Headline 4"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "user_choice,headline",
+    [
+        ("2", "Headline 7"),
+        (" 3 please", "Headline 2"),
+        ("0", "Headline 4"),
+        ("9", "Headline 4"),
+        ("abc", "Headline 4"),
+        ("", "Headline 4"),
+    ],
+)
+async def test_select_headline_parses_choice(
+    user_choice, headline, headline_state
+):
+    """Test valid choices pick a recommendation and others fall back."""
+    with patch("src.graph.nodes.interrupt", return_value=user_choice):
+        update = await select_headline_node(headline_state)
+
+    assert update["selected_headline_variation"].headline == headline
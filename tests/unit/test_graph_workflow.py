@@ -2,16 +2,40 @@
 Test the graph workflow routing to ensure proper flow control.
 """
 
-from src.graph.builder import create_content_workflow, process_human_feedback
+import asyncio
+from contextlib import ExitStack
+from typing import TypedDict
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import interrupt
+
+from src.agents import (
+    brief_merger,
+    brief_parser,
+    brief_validator,
+    content_editor,
+    content_writer,
+    headline_generator,
+    researcher,
+)
+from src.graph import nodes
+from src.graph.builder import (
+    MAX_REVISIONS,
+    create_content_workflow,
+    execute_with_interrupts,
+    process_human_feedback,
+    run_content_pipeline,
+    run_content_pipeline_batch,
+)
 from src.graph.state import WorkflowState, HumanFeedback
 
-
-def test_workflow_has_proper_routing():
-    """Test that workflow compiles and has expected nodes."""
-    workflow = create_content_workflow()
-
-    expected_nodes = [
+EXPECTED_NODES = frozenset(
+    {
         "parse_brief",
+        "prefetch_research",
         "validate_brief",
         "enhance_brief",
         "conduct_research",
@@ -19,18 +43,65 @@ def test_workflow_has_proper_routing():
         "select_headline",
         "make_editorial_decisions",
         "write_content",
+        "revise_content",
         "human_review",
-    ]
-
-    for node in expected_nodes:
-        assert node in workflow.nodes
+    }
+)
+
+
+def _construct(model, **values):
+    """Build a model without validation, failing if a field was renamed."""
+    assert values.keys() <= model.model_fields.keys()
+    return model.model_construct(**values)
+
+
+@pytest.fixture
+def pipeline_agents(test_model_override):
+    """Run every pipeline agent against the TestModel, offline."""
+    with ExitStack() as stack:
+        for module in (
+            brief_parser,
+            brief_validator,
+            brief_merger,
+            researcher,
+            headline_generator,
+            content_editor,
+            content_writer,
+        ):
+            stack.enter_context(
+                module.agent.override(model=test_model_override)
+            )
+        stack.enter_context(
+            patch("src.graph.nodes.search_web", AsyncMock(return_value=""))
+        )
+        yield
+
+
+@pytest.fixture(scope="module")
+def workflow():
+    """Build the workflow graph once for this module."""
+    return create_content_workflow()
+
+
+@pytest.fixture(scope="module")
+def compiled_app(workflow):
+    """Compile the shared workflow graph once for this module."""
+    return workflow.compile()
+
+
+def test_workflow_has_proper_routing(workflow):
+    """Test that workflow compiles and has expected nodes."""
+    missing = EXPECTED_NODES - set(workflow.nodes)
+    assert not missing, missing
 
 
 def test_human_feedback_routing_approve():
     """Test human feedback routes correctly when approved."""
-    state = WorkflowState(
+    state = _construct(
+        WorkflowState,
         original_input="test",
-        human_feedback=HumanFeedback(
+        human_feedback=_construct(
+            HumanFeedback,
             feedback_type="approve",
             comments="Looks good!",
             requested_changes=[],
@@ -45,10 +116,12 @@ def test_human_feedback_routing_approve():
 
 def test_human_feedback_routing_edit():
     """Test human feedback routes correctly for content edits."""
-    state = WorkflowState(
+    state = _construct(
+        WorkflowState,
         original_input="test",
         revision_count=1,
-        human_feedback=HumanFeedback(
+        human_feedback=_construct(
+            HumanFeedback,
             feedback_type="edit_content",
             comments="Needs improvement",
             requested_changes=["Add more examples"],
@@ -58,30 +131,116 @@ def test_human_feedback_routing_edit():
     )
 
     result = process_human_feedback(state)
-    assert result == "write_content"
+    assert result == "revise_content"
 
 
 def test_human_feedback_routing_revision_limit():
     """Test revision limit prevents infinite loops."""
-    state = WorkflowState(
+    state = _construct(
+        WorkflowState,
         original_input="test",
-        revision_count=3,
-        human_feedback=HumanFeedback(
-            feedback_type="edit_content",
-            comments="Still needs changes",
-            requested_changes=["More changes"],
-            priority="high",
-            preserve_elements=[],
-        ),
+        revision_count=MAX_REVISIONS,
+        # Only the feedback type matters once the limit is reached
+        human_feedback=_construct(HumanFeedback, feedback_type="edit_content"),
     )
 
     result = process_human_feedback(state)
     assert result == "finalize"
 
 
-def test_workflow_compilation():
+def test_workflow_compilation(compiled_app):
     """Test that workflow compiles without errors after routing fix."""
-    workflow = create_content_workflow()
-
-    compiled_app = workflow.compile()
     assert compiled_app is not None
+
+
+@pytest.mark.anyio
+async def test_run_content_pipeline_completes(pipeline_agents):
+    """Test a non-interactive run takes the defaults at every interrupt."""
+    state = await run_content_pipeline("Write about AI productivity tools")
+
+    assert state.is_complete is True
+    assert state.current_step == "completed"
+    assert state.draft_content is not None
+    assert state.human_feedback.feedback_type == "approve"
+    headlines = state.headline_options
+    top_choice = headlines.variations[headlines.recommended_top_3[0]]
+    assert state.selected_headline_variation == top_choice
+
+
+@pytest.mark.anyio
+async def test_run_content_pipeline_survives_prefetch_failure(
+    pipeline_agents,
+):
+    """Test the pipeline completes when the research prefetch fails."""
+    search = AsyncMock(side_effect=RuntimeError("search unavailable"))
+
+    with patch("src.graph.nodes.search_web", search):
+        state = await run_content_pipeline("Write about AI productivity tools")
+
+    search.assert_awaited_once()
+    assert state.is_complete is True
+    assert state.web_research is None
+
+
+@pytest.mark.anyio
+async def test_run_content_pipeline_batch_keeps_order(pipeline_agents):
+    """Test batch results follow input order and report completion."""
+    user_inputs = [
+        "Write about AI productivity tools",
+        "Write about remote work habits",
+        "Write about sustainable fashion",
+    ]
+
+    states = await run_content_pipeline_batch(user_inputs)
+
+    assert [state.original_input for state in states] == user_inputs
+    assert all(state.is_complete for state in states)
+
+
+@pytest.mark.anyio
+async def test_run_content_pipeline_batch_reports_failures(pipeline_agents):
+    """Test one failing brief does not discard the other results."""
+    parse_brief = nodes.parse_brief
+
+    async def parse_or_fail(user_input):
+        if user_input == "fail":
+            raise RuntimeError("parse failed")
+        return await parse_brief(user_input)
+
+    with patch("src.graph.nodes.parse_brief", side_effect=parse_or_fail):
+        states = await run_content_pipeline_batch(
+            ["Write about AI productivity tools", "fail"]
+        )
+
+    assert states[0].is_complete is True
+    assert isinstance(states[1], RuntimeError)
+
+
+class _QuestionsState(TypedDict, total=False):
+    topic: str
+    first: str
+    second: str
+
+
+@pytest.mark.anyio
+async def test_execute_with_interrupts_resumes_each_interrupt():
+    """Test consecutive interrupts are each answered, then the loop ends."""
+    graph = StateGraph(_QuestionsState)
+    graph.add_node("ask_first", lambda _: {"first": interrupt("First?")})
+    graph.add_node("ask_second", lambda _: {"second": interrupt("Second?")})
+    graph.add_edge(START, "ask_first")
+    graph.add_edge("ask_first", "ask_second")
+    graph.add_edge("ask_second", END)
+    app = graph.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "interrupts"}}
+    handler = AsyncMock(side_effect=["one", "two"])
+
+    await asyncio.wait_for(
+        execute_with_interrupts(app, {"topic": "AI"}, config, handler),
+        timeout=5,
+    )
+
+    assert handler.await_count == 2
+    snapshot = app.get_state(config)
+    assert snapshot.values == {"topic": "AI", "first": "one", "second": "two"}
+    assert snapshot.next == ()
@@ -0,0 +1,97 @@
+"""
+Test the LLM response cache used by structural agents.
+"""
+
+import pytest
+
+from src.agents.base import BaseAgent
+from src.agents.brief_validator import agent
+from src.models.agent_outputs import BriefValidation
+from src.utils.llm_cache import LLMCache
+
+
+def _validation(question: str) -> BriefValidation:
+    return BriefValidation(is_complete=False, clarifying_questions=question)
+
+
+def test_cache_round_trip_returns_copy():
+    """Test cached outputs come back equal but not shared."""
+    cache = LLMCache()
+    key = LLMCache.make_key("brief_validator", "model", "prompt")
+    output = _validation("Who is the audience?")
+
+    cache.set(key, output)
+    cached = cache.get(key, BriefValidation)
+
+    assert cached == output
+    assert cached is not output
+
+
+def test_cache_miss_returns_none():
+    """Test unknown keys miss the cache."""
+    cache = LLMCache()
+
+    assert cache.get("missing", BriefValidation) is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the in-memory cache is bounded by maxsize."""
+    cache = LLMCache(maxsize=2)
+    cache.set("a", _validation("a"))
+    cache.set("b", _validation("b"))
+    cache.get("a", BriefValidation)
+    cache.set("c", _validation("c"))
+
+    assert cache.get("a", BriefValidation) is not None
+    assert cache.get("b", BriefValidation) is None
+    assert cache.get("c", BriefValidation) is not None
+
+
+def test_cache_persists_to_sqlite(tmp_path):
+    """Test responses survive a new cache instance on the same file."""
+    path = str(tmp_path / "llm_cache.db")
+    LLMCache(path=path).set("key", _validation("Which tone?"))
+
+    cached = LLMCache(path=path).get("key", BriefValidation)
+
+    assert cached == _validation("Which tone?")
+
+
+@pytest.mark.anyio
+async def test_agent_cache_is_keyed_on_overridden_model(
+    test_llm_cache, test_model_override
+):
+    """Test outputs cached for the configured model are not replayed."""
+    stale = _validation("Stale output from the configured model")
+    test_llm_cache.set(agent._cache_key("probe"), stale)
+
+    with agent.override(model=test_model_override):
+        result = await agent.run("probe")
+
+    assert result != stale
+
+
+@pytest.mark.anyio
+async def test_agent_cache_skips_runs_with_kwargs(
+    test_llm_cache, test_model_override
+):
+    """Test runs with extra settings are neither served nor stored."""
+    with agent.override(model=test_model_override):
+        key = agent._cache_key("kwargs probe")
+        await agent.run("kwargs probe", model_settings={"temperature": 0.9})
+
+    assert test_llm_cache.get(key, BriefValidation) is None
+
+
+def test_agent_cache_key_covers_temperature():
+    """Test agents differing only in temperature do not share outputs."""
+    warmer = BaseAgent(
+        name=agent.name,
+        output_type=agent.output_type,
+        system_prompt=agent.system_prompt,
+        model_name=agent.model_name,
+        temperature=agent.temperature + 0.5,
+        cache=True,
+    )
+
+    assert warmer._cache_key("probe") != agent._cache_key("probe")
@@ -0,0 +1,62 @@
+"""
+Test YouTube search result handling without calling Apify.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.tools.youtube_search import (
+    TRANSCRIPT_ACTOR,
+    YOUTUBE_SEARCH_ACTOR,
+    get_youtube_videos,
+)
+
+# Search results returned by the stubbed actor, more than are requested
+SEARCH_ITEMS = [
+    {"title": f"Video {i}", "url": f"https://youtu.be/{i}"} for i in range(5)
+]
+FAILING_URL = "https://youtu.be/1"
+
+
+@pytest.fixture
+def apify_calls():
+    """Stub the Apify actors and record every transcript request."""
+    transcript_urls = []
+
+    def run_actor(client, actor_id, run_input):
+        if actor_id == YOUTUBE_SEARCH_ACTOR:
+            return SEARCH_ITEMS
+
+        assert actor_id == TRANSCRIPT_ACTOR
+        url = run_input["videoUrl"]
+        transcript_urls.append(url)
+        if url == FAILING_URL:
+            raise RuntimeError("transcript actor failed")
+        return [{"data": [{"text": "Transcript"}, {"text": url}]}]
+
+    with (
+        patch("src.tools.youtube_search._run_actor", run_actor),
+        patch("src.tools.youtube_search.settings.apify_api_key", "test-key"),
+    ):
+        yield transcript_urls
+
+
+@pytest.mark.anyio
+async def test_get_youtube_videos_fetches_transcripts(apify_calls):
+    """Test transcripts are fetched per result, in order, despite failures."""
+    videos = await get_youtube_videos(
+        "AI tools", max_results=3, client=object()
+    )
+
+    assert [video.title for video in videos] == [
+        "Video 0",
+        "Video 1",
+        "Video 2",
+    ]
+    assert sorted(apify_calls) == [item["url"] for item in SEARCH_ITEMS[:3]]
+    assert [video.transcript for video in videos] == [
+        "Transcript https://youtu.be/0",
+        None,
+        "Transcript https://youtu.be/2",
+    ]